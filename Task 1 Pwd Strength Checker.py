@@ -1,15 +1,42 @@
+import string
+
+UPPERCASE = frozenset(string.ascii_uppercase)
+LOWERCASE = frozenset(string.ascii_lowercase)
+DIGITS = frozenset(string.digits)
+SPECIAL_CHARS = frozenset('!@#$%^&*<>/-')
+
+UPPER = 1 << 0
+LOWER = 1 << 1
+DIGIT = 1 << 2
+SPECIAL = 1 << 3
+ALL_CLASSES = UPPER | LOWER | DIGIT | SPECIAL
+
 def check_password_strength(password):
     length = len(password) >= 8
-    contain_upper = any(char.isupper() for char in password)
-    contain_lower = any(char.islower() for char in password)
-    contain_digit = any(char.isdigit() for char in password)
-    contain_spec_char = any(char in '!@#$%^&*<>/-' for char in password)
+    flags = 0
+    for char in password:
+        if char in LOWERCASE:
+            flags |= LOWER
+        elif char in UPPERCASE:
+            flags |= UPPER
+        elif char in DIGITS:
+            flags |= DIGIT
+        elif char in SPECIAL_CHARS:
+            flags |= SPECIAL
+        elif not char.isascii():
+            # Non-ASCII characters still go through the Unicode checks
+            if char.isupper():
+                flags |= UPPER
+            elif char.islower():
+                flags |= LOWER
+            elif char.isdigit():
+                flags |= DIGIT
+        if flags == ALL_CLASSES:
+            break
 
-    if length and contain_upper and contain_lower and contain_digit and contain_spec_char:
+    if length and flags == ALL_CLASSES:
         return "Strong Password"
-    elif length and (contain_upper or contain_lower) and contain_digit:
-        return "Moderate Password"
-    elif length and (contain_upper or contain_lower) and contain_spec_char:
+    elif length and flags & (UPPER | LOWER) and flags & (DIGIT | SPECIAL):
         return "Moderate Password"
     else:
         return "Weak Passowrd"
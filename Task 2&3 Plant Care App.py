@@ -11,9 +11,11 @@ class Plant:
         self.last_watered = datetime.date.today()
         print(f"{self.name} watered successfully!")
 
-    def plant_condition(self):
+    def plant_condition(self, today=None):
         if self.last_watered:
-            days = (datetime.date.today() - self.last_watered).days
+            if today is None:
+                today = datetime.date.today()
+            days = (today - self.last_watered).days
             if days <= 7:
                 return "Good and healthy."
             else:
@@ -30,55 +32,76 @@ def daily_tips():
     ]
     return random.choice(tips)
 
+MENU = """
+Plant Care App Menu:
+1. Add a plant
+2. Water a plant
+3. Check plant health
+4. Get a daily tip
+5. Exit"""
+
+def handle_add(plants):
+    name = input("Enter plant name: ")
+    species = input("Enter plant species: ")
+    plant = Plant(name, species)
+    plants.append(plant)
+    print(f"{name} added successfully!")
+
+def handle_water(plants):
+    if not plants:
+        print("No plants added yet.")
+        return
+
+    for i, plant in enumerate(plants):
+        print(f"{i+1}. {plant.name}")
+
+    plant_index = int(input("Enter the number of the plant to water: ")) - 1
+
+    if 0 <= plant_index < len(plants):
+        plants[plant_index].water()
+    else:
+        print("Invalid plant number.")
+
+def handle_health(plants):
+    if not plants:
+        print("No plants added yet.")
+        return
+
+    today = datetime.date.today()
+    for plant in plants:
+        print(f"\nPlant Name: {plant.name}")
+        print(f"Species: {plant.species}")
+        print(f"Condition: {plant.plant_condition(today)}")
+
+def handle_tip(plants):
+    print(f"Daily Tip: {daily_tips()}")
+
+def handle_exit(plants):
+    print("Exiting...")
+    return False
+
+HANDLERS = {
+    '1': handle_add,
+    '2': handle_water,
+    '3': handle_health,
+    '4': handle_tip,
+    '5': handle_exit,
+}
+
 def main():
     plants = []
 
     while True:
-        print("\nPlant Care App Menu:")
-        print("1. Add a plant")
-        print("2. Water a plant")
-        print("3. Check plant health")
-        print("4. Get a daily tip")
-        print("5. Exit")
+        print(MENU)
 
         choice = input("Enter your choice: ")
 
-        if choice == '1':
-            name = input("Enter plant name: ")
-            species = input("Enter plant species: ")
-            plant = Plant(name, species)
-            plants.append(plant)
-            print(f"{name} added successfully!")
-        elif choice == '2':
-            if not plants:
-                print("No plants added yet.")
-                continue
-
-            for i, plant in enumerate(plants):
-                print(f"{i+1}. {plant.name}")
-
-            plant_index = int(input("Enter the number of the plant to water: ")) - 1
-
-            if 0 <= plant_index < len(plants):
-                plants[plant_index].water()
-            else:
-                print("Invalid plant number.")
-        elif choice == '3':
-            if not plants:
-                print("No plants added yet.")
-                continue
-
-            for plant in plants:
-                print(f"\nPlant Name: {plant.name}")
-                print(f"Species: {plant.species}")
-                print(f"Condition: {plant.plant_condition()}")
-        elif choice == '4':
-            print(f"Daily Tip: {daily_tips()}")
-        elif choice == '5':
-            print("Exiting...")
-            break
-        else:
+        handler = HANDLERS.get(choice)
+        if handler is None:
             print("Invalid choice.")
+            continue
+        if handler(plants) is False:
+            break
 
 if __name__ == "__main__":
     main()
@@ -1,11 +1,28 @@
 import ast
+import hashlib
+import io
 import os
 import re
-from typing import Dict, List, Optional
+import tokenize
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
-@dataclass
+# A plain "import a, b" statement; "from x import a, b" is fine under PEP 8
+_MULTIPLE_IMPORT_RE = re.compile(
+    rb'^\s*import\s+[\w.]+(?:\s+as\s+\w+)?'
+    rb'(?:\s*,\s*[\w.]+(?:\s+as\s+\w+)?)+\s*(?:#.*)?$'
+)
+
+# Severity levels, from most to least important
+SEVERITIES = ('HIGH', 'MEDIUM', 'LOW')
+
+# Below this many uncached files, starting worker processes costs more than it saves
+_MIN_PARALLEL_FILES = 32
+
+@dataclass(slots=True, frozen=True)
 class CodeIssue:
     """Class to represent a code issue found during review."""
     file_path: str
@@ -14,207 +31,338 @@ class CodeIssue:
     message: str
     severity: str
 
+def _iter_python_files(directory_path: str):
+    """Yield the paths of Python files under a directory, in os.walk order."""
+    try:
+        entries = list(os.scandir(directory_path))
+    except OSError:
+        return
+
+    subdirectories = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            # Like os.walk, list symlinked directories but do not descend into them
+            if not entry.is_symlink():
+                subdirectories.append(entry.path)
+        elif entry.name.endswith('.py'):
+            yield entry.path
+
+    for subdirectory in subdirectories:
+        yield from _iter_python_files(subdirectory)
+
+def _load_source(file_path: str) -> Tuple[Tuple[int, int], bytes]:
+    """Read a file as bytes, with its (mtime_ns, size) signature at read time.
+
+    Newlines are translated the same way text mode does.
+    """
+    with open(file_path, 'rb') as file:
+        stat = os.fstat(file.fileno())
+        source = file.read()
+
+    if b'\r' in source:
+        source = source.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    return (stat.st_mtime_ns, stat.st_size), source
+
+def _error_issues(file_path: str, error: Exception) -> Dict[str, List[CodeIssue]]:
+    """Return the issue groups for a file that could not be read or parsed."""
+    issues = {severity: [] for severity in SEVERITIES}
+    issues['HIGH'].append(CodeIssue(
+        file_path=file_path,
+        line_number=0,
+        issue_type='ERROR',
+        message=f'Failed to parse file: {str(error)}',
+        severity='HIGH'
+    ))
+    return issues
+
+class _TreeChecker(ast.NodeVisitor):
+    """Check naming conventions, complexity and docstrings in one tree walk."""
+
+    def __init__(self, issues: Dict[str, List[CodeIssue]], file_path: str, max_complexity: int):
+        self.file_path = file_path
+        self.max_complexity = max_complexity
+        self.high_issues = issues['HIGH']
+        self.medium_issues = issues['MEDIUM']
+        self.low_issues = issues['LOW']
+        # [complexity, issue index] for each function being visited
+        self.complexity_stack = []
+
+    def visit_ClassDef(self, node):
+        if not node.name[0].isupper():
+            self.medium_issues.append(CodeIssue(
+                file_path=self.file_path,
+                line_number=node.lineno,
+                issue_type='NAMING_CONVENTION',
+                message=f'Class name "{node.name}" should use CapWords convention',
+                severity='MEDIUM'
+            ))
+        if not ast.get_docstring(node):
+            self.low_issues.append(CodeIssue(
+                file_path=self.file_path,
+                line_number=node.lineno,
+                issue_type='MISSING_DOCSTRING',
+                message=f'Class "{node.name}" is missing a docstring',
+                severity='LOW'
+            ))
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node):
+        if not node.name.islower() and '_' not in node.name:
+            self.medium_issues.append(CodeIssue(
+                file_path=self.file_path,
+                line_number=node.lineno,
+                issue_type='NAMING_CONVENTION',
+                message=f'Function name "{node.name}" should use lowercase_with_underscores',
+                severity='MEDIUM'
+            ))
+        if not ast.get_docstring(node):
+            self.low_issues.append(CodeIssue(
+                file_path=self.file_path,
+                line_number=node.lineno,
+                issue_type='MISSING_DOCSTRING',
+                message=f'Function "{node.name}" is missing a docstring',
+                severity='LOW'
+            ))
+        self.check_complexity(node)
+
+    def check_complexity(self, node):
+        """Visit a function body, then report it if its complexity is too high."""
+        self.complexity_stack.append([1, len(self.high_issues)])  # Base complexity
+        self.generic_visit(node)
+        complexity, index = self.complexity_stack.pop()
+        if self.complexity_stack:
+            # Branches of nested functions also count towards the outer one
+            self.complexity_stack[-1][0] += complexity - 1
+
+        if complexity > self.max_complexity:
+            # Insert ahead of nested functions' issues to keep source order
+            self.high_issues.insert(index, CodeIssue(
+                file_path=self.file_path,
+                line_number=node.lineno,
+                issue_type='COMPLEXITY',
+                message=f'Function "{node.name}" has complexity of {complexity} (max is {self.max_complexity})',
+                severity='HIGH'
+            ))
+
+    # Async functions are only checked for complexity
+    visit_AsyncFunctionDef = check_complexity
+
+    def visit_branch(self, node):
+        if self.complexity_stack:
+            self.complexity_stack[-1][0] += 1
+        self.generic_visit(node)
+
+    visit_If = visit_While = visit_For = visit_AsyncFor = visit_ExceptHandler = visit_branch
+
+    def visit_BoolOp(self, node):
+        if self.complexity_stack:
+            self.complexity_stack[-1][0] += len(node.values) - 1
+        self.generic_visit(node)
+
 class CodeReviewTool:
     def __init__(self):
-        self.issues: List[CodeIssue] = []
+        # Issues for the last reviewed file, grouped by severity; only kept
+        # for backward compatibility, the checks never write to it
+        self.issues: Dict[str, List[CodeIssue]] = {severity: [] for severity in SEVERITIES}
+        # Absolute file path -> ((mtime_ns, size), SHA-256 of the content,
+        # issues); a file only keeps the entry for its latest reviewed content
+        self._cache: Dict[str, Tuple[Tuple[int, int], bytes, Dict[str, List[CodeIssue]]]] = {}
         
-    def review_file(self, file_path: str) -> List[CodeIssue]:
-        """Review a single file for code issues."""
+    def review_file(self, file_path: str) -> Dict[str, List[CodeIssue]]:
+        """Review a single file for code issues, grouped by severity."""
         if not file_path.endswith('.py'):
-            return []
-            
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-                
-            # Parse the code into an AST
-            tree = ast.parse(content)
-            
-            # Reset issues for this file
-            self.issues = []
-            
-            # Run various checks
-            self._check_line_length(content, file_path)
-            self._check_naming_conventions(tree, file_path)
-            self._check_complexity(tree, file_path)
-            self._check_docstrings(tree, file_path)
-            self._check_import_style(content, file_path)
-            
-            return self.issues
-            
-        except Exception as e:
-            self.issues.append(CodeIssue(
-                file_path=file_path,
-                line_number=0,
-                issue_type='ERROR',
-                message=f'Failed to parse file: {str(e)}',
-                severity='HIGH'
-            ))
-            return self.issues
+            return {severity: [] for severity in SEVERITIES}
+
+        # Reuse the previous result if the file has not changed on disk
+        issues = self._cached_issues(file_path)
+        if issues is None:
+            signature, digest, issues = self._review_path(file_path)
+            self._store(file_path, signature, digest, issues)
+
+        self.issues = issues
+        return issues
     
-    def review_directory(self, directory_path: str) -> Dict[str, List[CodeIssue]]:
+    def review_directory(self, directory_path: str) -> Dict[str, Dict[str, List[CodeIssue]]]:
         """Review all Python files in a directory and its subdirectories."""
         results = {}
-        for root, _, files in os.walk(directory_path):
-            for file in files:
-                if file.endswith('.py'):
-                    file_path = os.path.join(root, file)
-                    results[file_path] = self.review_file(file_path)
+        misses = []
+        for file_path in _iter_python_files(directory_path):
+            # Cached files are filled in now; the rest hold their place in the
+            # results until they have been reviewed
+            results[file_path] = self._cached_issues(file_path)
+            if results[file_path] is None:
+                misses.append(file_path)
+
+        reviewed = None
+        if len(misses) >= _MIN_PARALLEL_FILES:
+            # Files are independent, so review them in parallel across
+            # processes; each worker reads the files it is given
+            try:
+                with ProcessPoolExecutor() as executor:
+                    reviewed = list(executor.map(CodeReviewTool._review_one, misses, chunksize=16))
+            except (BrokenProcessPool, OSError, NotImplementedError):
+                # The pool could not start or died; review in this process instead
+                reviewed = None
+        if reviewed is None:
+            reviewed = [self._review_path(file_path) for file_path in misses]
+
+        for file_path, (signature, digest, issues) in zip(misses, reviewed):
+            self._store(file_path, signature, digest, issues)
+            results[file_path] = issues
         return results
 
-    def _check_line_length(self, content: str, file_path: str, max_length: int = 79):
-        """Check if any lines exceed the maximum length."""
-        for i, line in enumerate(content.split('\n'), 1):
-            if len(line) > max_length:
-                self.issues.append(CodeIssue(
-                    file_path=file_path,
-                    line_number=i,
-                    issue_type='LINE_LENGTH',
-                    message=f'Line length exceeds {max_length} characters',
-                    severity='LOW'
-                ))
+    def _cached_issues(self, file_path: str) -> Optional[Dict[str, List[CodeIssue]]]:
+        """Return a copy of the cached issues for a file, or None if it changed.
 
-    def _check_naming_conventions(self, tree: ast.AST, file_path: str):
-        """Check naming conventions for variables, functions, and classes."""
-        class NamingConventionChecker(ast.NodeVisitor):
-            def __init__(self, review_tool):
-                self.review_tool = review_tool
+        A file counts as unchanged while its (mtime_ns, size) signature matches,
+        so a cache hit needs only a stat and no read.
+        """
+        cached = self._cache.get(os.path.abspath(file_path))
+        if cached is None:
+            return None
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        if cached[0] != (stat.st_mtime_ns, stat.st_size):
+            return None
+        return {severity: list(group) for severity, group in cached[2].items()}
 
-            def visit_ClassDef(self, node):
-                if not node.name[0].isupper():
-                    self.review_tool.issues.append(CodeIssue(
-                        file_path=file_path,
-                        line_number=node.lineno,
-                        issue_type='NAMING_CONVENTION',
-                        message=f'Class name "{node.name}" should use CapWords convention',
-                        severity='MEDIUM'
-                    ))
-                self.generic_visit(node)
+    def _review_path(self, file_path: str) -> Tuple[Optional[Tuple[int, int]], bytes, Dict[str, List[CodeIssue]]]:
+        """Read and review a file, returning the signature and digest it was reviewed at."""
+        try:
+            signature, source = _load_source(file_path)
+        except Exception as e:
+            return None, b'', _error_issues(file_path, e)
 
-            def visit_FunctionDef(self, node):
-                if not node.name.islower() and '_' not in node.name:
-                    self.review_tool.issues.append(CodeIssue(
-                        file_path=file_path,
-                        line_number=node.lineno,
-                        issue_type='NAMING_CONVENTION',
-                        message=f'Function name "{node.name}" should use lowercase_with_underscores',
-                        severity='MEDIUM'
-                    ))
-                self.generic_visit(node)
-
-        checker = NamingConventionChecker(self)
-        checker.visit(tree)
-
-    def _check_complexity(self, tree: ast.AST, file_path: str, max_complexity: int = 10):
-        """Check cyclomatic complexity of functions."""
-        class ComplexityChecker(ast.NodeVisitor):
-            def __init__(self, review_tool):
-                self.review_tool = review_tool
-
-            def visit_FunctionDef(self, node):
-                complexity = 1  # Base complexity
-                # Count branches
-                for n in ast.walk(node):
-                    if isinstance(n, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
-                        complexity += 1
-                    elif isinstance(n, ast.BoolOp):
-                        complexity += len(n.values) - 1
-
-                if complexity > max_complexity:
-                    self.review_tool.issues.append(CodeIssue(
-                        file_path=file_path,
-                        line_number=node.lineno,
-                        issue_type='COMPLEXITY',
-                        message=f'Function "{node.name}" has complexity of {complexity} (max is {max_complexity})',
-                        severity='HIGH'
-                    ))
-                self.generic_visit(node)
+        digest = hashlib.sha256(source).digest()
+        cached = self._cache.get(os.path.abspath(file_path))
+        if cached is not None and cached[1] == digest:
+            # Only the signature changed (e.g. the file was touched)
+            return signature, digest, {severity: list(group) for severity, group in cached[2].items()}
+        return signature, digest, self._review_source(file_path, source)
+
+    def _store(self, file_path: str, signature: Optional[Tuple[int, int]], digest: bytes,
+               issues: Dict[str, List[CodeIssue]]):
+        """Cache a copy of a file's issues, replacing any entry for older content."""
+        if signature is None:
+            # The file could not be read; review it again next time
+            return
+        self._cache[os.path.abspath(file_path)] = (
+            signature, digest, {severity: list(group) for severity, group in issues.items()}
+        )
 
-        checker = ComplexityChecker(self)
-        checker.visit(tree)
+    def _review_source(self, file_path: str, source: bytes) -> Dict[str, List[CodeIssue]]:
+        """Parse and check the source of a single file."""
+        # Collect issues for this file locally so concurrent reviews don't share state
+        issues = {severity: [] for severity in SEVERITIES}
+        try:
+            # Parse the code into an AST; ast.parse decodes the bytes itself,
+            # honouring any BOM or encoding cookie
+            tree = ast.parse(source, filename=file_path)
+            
+            # Run various checks
+            self._check_line_length(source, file_path, issues)
+            self._check_tree(tree, file_path, issues)
+            self._check_import_style(source, file_path, issues)
+        except Exception as e:
+            issues['HIGH'].extend(_error_issues(file_path, e)['HIGH'])
+        return issues
 
-    def _check_docstrings(self, tree: ast.AST, file_path: str):
-        """Check for missing docstrings in functions and classes."""
-        class DocstringChecker(ast.NodeVisitor):
-            def __init__(self, review_tool):
-                self.review_tool = review_tool
+    @staticmethod
+    def _review_one(file_path: str) -> Tuple[Optional[Tuple[int, int]], bytes, Dict[str, List[CodeIssue]]]:
+        """Read and review a file with a fresh tool, for use in worker processes."""
+        return CodeReviewTool()._review_path(file_path)
 
-            def visit_FunctionDef(self, node):
-                if not ast.get_docstring(node):
-                    self.review_tool.issues.append(CodeIssue(
-                        file_path=file_path,
-                        line_number=node.lineno,
-                        issue_type='MISSING_DOCSTRING',
-                        message=f'Function "{node.name}" is missing a docstring',
-                        severity='LOW'
-                    ))
-                self.generic_visit(node)
+    def _check_line_length(self, source: bytes, file_path: str,
+                           out: Dict[str, List[CodeIssue]], max_length: int = 79):
+        """Check if any lines exceed the maximum length."""
+        append = out['LOW'].append
 
-            def visit_ClassDef(self, node):
-                if not ast.get_docstring(node):
-                    self.review_tool.issues.append(CodeIssue(
+        if source.isascii():
+            # Fast path: for ASCII sources the byte count is the line length
+            line_number = 1
+            start = 0
+            while True:
+                end = source.find(b'\n', start)
+                line_end = len(source) if end == -1 else end
+                if line_end - start > max_length:
+                    append(CodeIssue(
                         file_path=file_path,
-                        line_number=node.lineno,
-                        issue_type='MISSING_DOCSTRING',
-                        message=f'Class "{node.name}" is missing a docstring',
+                        line_number=line_number,
+                        issue_type='LINE_LENGTH',
+                        message=f'Line length exceeds {max_length} characters',
                         severity='LOW'
                     ))
-                self.generic_visit(node)
+                if end == -1:
+                    return
+                start = end + 1
+                line_number += 1
 
-        checker = DocstringChecker(self)
-        checker.visit(tree)
+        # Otherwise decode the source so lengths are counted in characters
+        encoding, _ = tokenize.detect_encoding(io.BytesIO(source).readline)
+        for i, line in enumerate(io.StringIO(source.decode(encoding)), 1):
+            if len(line.rstrip('\n')) > max_length:
+                append(CodeIssue(
+                    file_path=file_path,
+                    line_number=i,
+                    issue_type='LINE_LENGTH',
+                    message=f'Line length exceeds {max_length} characters',
+                    severity='LOW'
+                ))
+
+    def _check_tree(self, tree: ast.AST, file_path: str,
+                    out: Dict[str, List[CodeIssue]], max_complexity: int = 10):
+        """Check naming conventions, complexity and docstrings in one pass."""
+        _TreeChecker(out, file_path, max_complexity).visit(tree)
 
-    def _check_import_style(self, content: str, file_path: str):
+    def _check_import_style(self, source: bytes, file_path: str, out: Dict[str, List[CodeIssue]]):
         """Check import statement style and organization."""
-        lines = content.split('\n')
-        import_lines = []
-        
-        for i, line in enumerate(lines, 1):
-            if line.strip().startswith(('import ', 'from ')):
-                import_lines.append((i, line.strip()))
-
-        # Check for multiple imports on one line
-        for line_num, line in import_lines:
-            if ',' in line and not 'import {' in line:  # Ignore f-strings or formatted strings
-                self.issues.append(CodeIssue(
+        append = out['LOW'].append
+        match = _MULTIPLE_IMPORT_RE.match
+        for i, line in enumerate(io.BytesIO(source), 1):
+            # Check for multiple imports on one line
+            if match(line):
+                append(CodeIssue(
                     file_path=file_path,
-                    line_number=line_num,
+                    line_number=i,
                     issue_type='IMPORT_STYLE',
                     message='Multiple imports on one line should be split',
                     severity='LOW'
                 ))
 
-def generate_report(issues: Dict[str, List[CodeIssue]]) -> str:
+def generate_report(issues: Dict[str, Dict[str, List[CodeIssue]]]) -> str:
     """Generate a formatted report from the code review results."""
-    report = "Code Review Report\n"
-    report += "=================\n\n"
+    parts = []
+    add = parts.append
+    add("Code Review Report\n")
+    add("=================\n\n")
     
-    total_issues = sum(len(file_issues) for file_issues in issues.values())
-    report += f"Total files analyzed: {len(issues)}\n"
-    report += f"Total issues found: {total_issues}\n\n"
+    total_issues = sum(
+        len(group) for file_issues in issues.values() for group in file_issues.values()
+    )
+    add(f"Total files analyzed: {len(issues)}\n")
+    add(f"Total issues found: {total_issues}\n\n")
     
     for file_path, file_issues in issues.items():
-        if file_issues:
-            report += f"\nFile: {file_path}\n"
-            report += "-" * (len(file_path) + 6) + "\n"
-            
-            # Group issues by severity
-            severity_groups = {
-                'HIGH': [],
-                'MEDIUM': [],
-                'LOW': []
-            }
-            
-            for issue in file_issues:
-                severity_groups[issue.severity].append(issue)
+        if any(file_issues.values()):
+            add(f"\nFile: {file_path}\n")
+            add("-" * (len(file_path) + 6) + "\n")
             
-            for severity in ['HIGH', 'MEDIUM', 'LOW']:
-                if severity_groups[severity]:
-                    report += f"\n{severity} Priority Issues:\n"
-                    for issue in severity_groups[severity]:
-                        report += f"- Line {issue.line_number}: {issue.message} ({issue.issue_type})\n"
+            # Issues are already grouped by severity
+            for severity in SEVERITIES:
+                if file_issues[severity]:
+                    add(f"\n{severity} Priority Issues:\n")
+                    parts.extend(
+                        f"- Line {issue.line_number}: {issue.message} ({issue.issue_type})\n"
+                        for issue in file_issues[severity]
+                    )
     
-    return report
+    return "".join(parts)
 
 # Example usage
 if __name__ == "__main__":